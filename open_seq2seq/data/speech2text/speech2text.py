@@ -56,6 +56,8 @@ class Speech2TextDataLayer(DataLayer):
         'gain': float,
         'features_mean': np.ndarray,
         'features_std_dev': np.ndarray,
+        'prefetch_to_device': bool,
+        'bucket_boundaries': list,
     })
 
   def __init__(self, params, model, num_workers, worker_id):
@@ -105,6 +107,14 @@ class Speech2TextDataLayer(DataLayer):
     * **precompute_mel_basis** (bool) --- compute and store mel basis. If False,
       it will compute it for every get_speech_features call. Default: False
     * **sample_freq** (int) --- required for precompute_mel_basis
+    * **prefetch_to_device** (bool) --- prefetch batches directly to the GPU
+      memory, overlapping the host to device copy with computation.
+      Default: False
+    * **bucket_boundaries** (list) --- if set, training batches are formed
+      from utterances of similar length to reduce padding. Contains the
+      upper length bounds (in feature frames) of the buckets, e.g.
+      ``[200, 400, 600, 800, 1000, 1200, 1400, 1600]``. Only used in
+      train mode.
     """
     super(Speech2TextDataLayer, self).__init__(params, model,
                                                num_workers, worker_id)
@@ -248,13 +258,31 @@ class Speech2TextDataLayer(DataLayer):
             [x, x_len, y, y_len],
             num_parallel_calls=8,
         )
-        self._dataset = self._dataset.padded_batch(
-            self.params['batch_size'],
-            padded_shapes=([None, self.params['num_audio_features']],
-                           1, [None], 1),
-            padding_values=(
-                tf.cast(0, self.params['dtype']), 0, self.target_pad_value, 0),
-        )
+        padded_shapes = ([None, self.params['num_audio_features']],
+                         1, [None], 1)
+        padding_values = (
+            tf.cast(0, self.params['dtype']), 0, self.target_pad_value, 0)
+        if (self.params.get('bucket_boundaries', None) and
+            self.params['mode'] == 'train'):
+          # batch size is the same for all buckets, since the model relies
+          # on a static batch dimension
+          boundaries = self.params['bucket_boundaries']
+          self._dataset = self._dataset.apply(
+              tf.contrib.data.bucket_by_sequence_length(
+                  element_length_func=lambda x, x_len, y, y_len: x_len[0],
+                  bucket_boundaries=boundaries,
+                  bucket_batch_sizes=[self.params['batch_size']] *
+                                     (len(boundaries) + 1),
+                  padded_shapes=padded_shapes,
+                  padding_values=padding_values,
+              )
+          )
+        else:
+          self._dataset = self._dataset.padded_batch(
+              self.params['batch_size'],
+              padded_shapes=padded_shapes,
+              padding_values=padding_values,
+          )
       else:
         indices = self.split_data(
             np.array(list(map(str, range(len(self.all_files)))))
@@ -293,9 +321,23 @@ class Speech2TextDataLayer(DataLayer):
             padded_shapes=([None, self.params['num_audio_features']], 1, 1)
         )
 
-      self._iterator = self._dataset.prefetch(tf.contrib.data.AUTOTUNE)\
-                           .make_initializable_iterator()
+      if self.params.get('prefetch_to_device', False):
+        # copies batches to the GPU in the background, so that the host to
+        # device transfer overlaps with the computation of the previous step
+        if self._model.on_horovod:
+          gpu_id = 0
+        else:
+          gpu_id = self._model.gpu_ids[self._worker_id]
+        output_device = '/gpu:{}'.format(gpu_id)
+        self._iterator = self._dataset.apply(
+            tf.contrib.data.prefetch_to_device(output_device, buffer_size=2)
+        ).make_initializable_iterator()
+      else:
+        output_device = '/cpu:0'
+        self._iterator = self._dataset.prefetch(tf.contrib.data.AUTOTUNE)\
+                             .make_initializable_iterator()
 
+    with tf.device(output_device):
       if self.params['mode'] != 'infer':
         x, x_length, y, y_length = self._iterator.get_next()
         # need to explicitly set batch size dimension
@@ -0,0 +1,54 @@
+# Copyright (c) 2019 NVIDIA Corporation
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import numpy as np
+import tensorflow as tf
+from six.moves import range
+
+from .speech2text import Speech2TextDataLayer
+
+
+class Speech2TextDataLayerTests(tf.test.TestCase):
+  def setUp(self):
+    self.params = {
+        'num_audio_features': 40,
+        'input_type': 'logfbank',
+        'vocab_file': 'open_seq2seq/test_utils/toy_speech_data/vocab.txt',
+        'dataset_files': [
+            'open_seq2seq/test_utils/toy_speech_data/toy_data.csv',
+        ],
+        'shuffle': True,
+        'batch_size': 3,
+        'mode': 'train',
+    }
+
+  def test_bucket_boundaries(self):
+    # toy utterances are ~270-500, ~680 and ~850-900 frames long,
+    # so each of the three buckets gets at least one full batch
+    boundaries = [600, 800]
+    self.params['bucket_boundaries'] = boundaries
+    dl = Speech2TextDataLayer(params=self.params, model=None,
+                              num_workers=None, worker_id=None)
+    dl.build_graph()
+    lower_bounds = [0] + boundaries
+    upper_bounds = boundaries + [np.inf]
+    with self.test_session(use_gpu=True) as sess:
+      sess.run(dl.iterator.initializer)
+      for _ in range(10):
+        et = sess.run(dl.input_tensors)
+        x, x_length = et['source_tensors']
+        y, y_length = et['target_tensors']
+        self.assertEqual(x.shape[0], self.params['batch_size'])
+        self.assertEqual(x_length.shape[0], self.params['batch_size'])
+        self.assertEqual(y.shape[0], self.params['batch_size'])
+        self.assertEqual(y_length.shape[0], self.params['batch_size'])
+        # all utterances of the batch come from the same bucket and
+        # are only padded to the longest of them
+        bucket = np.searchsorted(boundaries, x_length[0], side='right')
+        self.assertTrue(np.all(x_length >= lower_bounds[bucket]))
+        self.assertTrue(np.all(x_length < upper_bounds[bucket]))
+        self.assertEqual(x.shape[1], np.max(x_length))
+
+if __name__ == '__main__':
+  tf.test.main()
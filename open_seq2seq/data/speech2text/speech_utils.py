@@ -107,7 +107,7 @@ def get_preprocessed_data_path(filename, params):
   # print(list(params.keys()))
   ignored_params = ["cache_features", "cache_format", "cache_regenerate",
                     "vocab_file", "dataset_files", "shuffle", "batch_size",
-                    "max_duration",
+                    "max_duration", "bucket_boundaries", "prefetch_to_device",
                     "mode", "interactive", "autoregressive", "char2idx",
                     "tgt_vocab_size", "idx2char", "dtype"]
 
@@ -2,6 +2,8 @@
 from __future__ import absolute_import, division, print_function
 from __future__ import unicode_literals
 
+import contextlib
+
 import tensorflow as tf
 
 from .encoder import Encoder
@@ -11,6 +13,11 @@ from open_seq2seq.parts.cnns.conv_blocks import conv_actv, conv_bn_actv,\
                                                 conv_bn_res_bn_actv
 
 
+@contextlib.contextmanager
+def _no_jit_scope():
+  yield
+
+
 class TDNNEncoder(Encoder):
   """General time delay neural network (TDNN) encoder. Fully convolutional model
   """
@@ -33,6 +40,7 @@ class TDNNEncoder(Encoder):
         'use_conv_mask': bool,
         'drop_block_prob': float,
         'drop_block_index': int,
+        'use_jit_scope': bool,
     })
 
   def __init__(self, params, model, name="w2l_encoder", mode='train'):
@@ -81,6 +89,10 @@ class TDNNEncoder(Encoder):
     * **use_conv_mask** (bool) --- whether to apply a sequence mask prior to
       convolution operations. Defaults to False for backwards compatibility.
       Recommended to set as True
+    * **use_jit_scope** (bool) --- whether to build the convolutional layers
+      inside an XLA jit scope, so that convolution, normalization, activation
+      and dropout are compiled and fused together. Unlike the model level
+      ``use_xla_jit`` it only affects the encoder. Defaults to False.
     """
     super(TDNNEncoder, self).__init__(params, model, name, mode)
 
@@ -167,92 +179,101 @@ class TDNNEncoder(Encoder):
     # ----- Convolutional layers ---------------------------------------------
     convnet_layers = self.params['convnet_layers']
 
-    for idx_convnet in range(len(convnet_layers)):
-      layer_type = convnet_layers[idx_convnet]['type']
-      layer_repeat = convnet_layers[idx_convnet]['repeat']
-      ch_out = convnet_layers[idx_convnet]['num_channels']
-      kernel_size = convnet_layers[idx_convnet]['kernel_size']
-      strides = convnet_layers[idx_convnet]['stride']
-      padding = convnet_layers[idx_convnet]['padding']
-      dilation = convnet_layers[idx_convnet]['dilation']
-      dropout_keep = convnet_layers[idx_convnet].get(
-          'dropout_keep_prob', dropout_keep_prob) if training else 1.0
-      residual = convnet_layers[idx_convnet].get('residual', False)
-      residual_dense = convnet_layers[idx_convnet].get('residual_dense', False)
-
-
-      # For the first layer in the block, apply a mask
-      if self.params.get("use_conv_mask", False):
-        conv_feats = conv_feats * mask
-
-      if residual:
-        layer_res = conv_feats
-        if residual_dense:
-          residual_aggregation.append(layer_res)
-          layer_res = residual_aggregation
-
-      for idx_layer in range(layer_repeat):
-
-        if padding == "VALID":
-          src_length = (src_length - kernel_size[0]) // strides[0] + 1
-          max_len = (max_len - kernel_size[0]) // strides[0] + 1
-        else:
-          src_length = (src_length + strides[0] - 1) // strides[0]
-          max_len = (max_len + strides[0] - 1) // strides[0]
-
-        # For all layers other than first layer, apply mask
-        if idx_layer > 0 and self.params.get("use_conv_mask", False):
+    if self.params.get('use_jit_scope', False):
+      # lets XLA fuse convolutions with normalization, activation and dropout
+      jit_scope = tf.contrib.compiler.jit.experimental_jit_scope
+    else:
+      jit_scope = _no_jit_scope
+
+    with jit_scope():
+      for idx_convnet in range(len(convnet_layers)):
+        layer_type = convnet_layers[idx_convnet]['type']
+        layer_repeat = convnet_layers[idx_convnet]['repeat']
+        ch_out = convnet_layers[idx_convnet]['num_channels']
+        kernel_size = convnet_layers[idx_convnet]['kernel_size']
+        strides = convnet_layers[idx_convnet]['stride']
+        padding = convnet_layers[idx_convnet]['padding']
+        dilation = convnet_layers[idx_convnet]['dilation']
+        dropout_keep = convnet_layers[idx_convnet].get(
+            'dropout_keep_prob', dropout_keep_prob) if training else 1.0
+        residual = convnet_layers[idx_convnet].get('residual', False)
+        residual_dense = convnet_layers[idx_convnet].get('residual_dense',
+                                                         False)
+
+
+        # For the first layer in the block, apply a mask
+        if self.params.get("use_conv_mask", False):
           conv_feats = conv_feats * mask
 
-        # Since we have a stride 2 layer, we need to update mask for future operations
-        if (self.params.get("use_conv_mask", False) and
-            (padding == "VALID" or strides[0] > 1)):
-          mask = tf.sequence_mask(
-              lengths=src_length,
-              maxlen=max_len,
-              dtype=conv_feats.dtype
-          )
-          mask = tf.expand_dims(mask, 2)
-
-        if residual and idx_layer == layer_repeat - 1:
-          conv_feats = conv_bn_res_bn_actv(
-              layer_type=layer_type,
-              name="conv{}{}".format(
-                  idx_convnet + 1, idx_layer + 1),
-              inputs=conv_feats,
-              res_inputs=layer_res,
-              filters=ch_out,
-              kernel_size=kernel_size,
-              activation_fn=self.params['activation_fn'],
-              strides=strides,
-              padding=padding,
-              dilation=dilation,
-              regularizer=regularizer,
-              training=training,
-              data_format=data_format,
-              drop_block_prob=drop_block_prob,
-              drop_block=(drop_block_index == idx_convnet),
-              **normalization_params
-          )
-        else:
-          conv_feats = conv_block(
-              layer_type=layer_type,
-              name="conv{}{}".format(
-                  idx_convnet + 1, idx_layer + 1),
-              inputs=conv_feats,
-              filters=ch_out,
-              kernel_size=kernel_size,
-              activation_fn=self.params['activation_fn'],
-              strides=strides,
-              padding=padding,
-              dilation=dilation,
-              regularizer=regularizer,
-              training=training,
-              data_format=data_format,
-              **normalization_params
-          )
-
-        conv_feats = tf.nn.dropout(x=conv_feats, keep_prob=dropout_keep)
+        if residual:
+          layer_res = conv_feats
+          if residual_dense:
+            residual_aggregation.append(layer_res)
+            layer_res = residual_aggregation
+
+        for idx_layer in range(layer_repeat):
+
+          if padding == "VALID":
+            src_length = (src_length - kernel_size[0]) // strides[0] + 1
+            max_len = (max_len - kernel_size[0]) // strides[0] + 1
+          else:
+            src_length = (src_length + strides[0] - 1) // strides[0]
+            max_len = (max_len + strides[0] - 1) // strides[0]
+
+          # For all layers other than first layer, apply mask
+          if idx_layer > 0 and self.params.get("use_conv_mask", False):
+            conv_feats = conv_feats * mask
+
+          # Since we have a stride 2 layer, we need to update mask for future
+          # operations
+          if (self.params.get("use_conv_mask", False) and
+              (padding == "VALID" or strides[0] > 1)):
+            mask = tf.sequence_mask(
+                lengths=src_length,
+                maxlen=max_len,
+                dtype=conv_feats.dtype
+            )
+            mask = tf.expand_dims(mask, 2)
+
+          if residual and idx_layer == layer_repeat - 1:
+            conv_feats = conv_bn_res_bn_actv(
+                layer_type=layer_type,
+                name="conv{}{}".format(
+                    idx_convnet + 1, idx_layer + 1),
+                inputs=conv_feats,
+                res_inputs=layer_res,
+                filters=ch_out,
+                kernel_size=kernel_size,
+                activation_fn=self.params['activation_fn'],
+                strides=strides,
+                padding=padding,
+                dilation=dilation,
+                regularizer=regularizer,
+                training=training,
+                data_format=data_format,
+                drop_block_prob=drop_block_prob,
+                drop_block=(drop_block_index == idx_convnet),
+                **normalization_params
+            )
+          else:
+            conv_feats = conv_block(
+                layer_type=layer_type,
+                name="conv{}{}".format(
+                    idx_convnet + 1, idx_layer + 1),
+                inputs=conv_feats,
+                filters=ch_out,
+                kernel_size=kernel_size,
+                activation_fn=self.params['activation_fn'],
+                strides=strides,
+                padding=padding,
+                dilation=dilation,
+                regularizer=regularizer,
+                training=training,
+                data_format=data_format,
+                **normalization_params
+            )
+
+          conv_feats = tf.nn.dropout(x=conv_feats, keep_prob=dropout_keep)
 
     outputs = conv_feats
 
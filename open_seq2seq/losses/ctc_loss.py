@@ -22,6 +22,7 @@ class CTCLoss(Loss):
   def get_optional_params():
     return dict(Loss.get_optional_params(), **{
         'mask_nan': bool,
+        'use_gpu_ctc': bool,
     })
 
   def __init__(self, params, model, name="ctc_loss"):
@@ -33,9 +34,16 @@ class CTCLoss(Loss):
 
     * **mask_nan** (bool) --- whether to mask nans in the loss output. Defaults
       to True.
+    * **use_gpu_ctc** (bool) --- whether to compute the loss with
+      ``tf.nn.ctc_loss_v2`` on dense labels, which is implemented with regular
+      TensorFlow ops and can run on GPU, instead of the CPU-only
+      ``tf.nn.ctc_loss`` kernel. This avoids copying the logits to the host
+      every step. As with ``tf.nn.ctc_loss``, samples with targets longer
+      than the inputs are ignored. Defaults to False.
     """
     super(CTCLoss, self).__init__(params, model, name)
     self._mask_nan = self.params.get("mask_nan", True)
+    self._use_gpu_ctc = self.params.get("use_gpu_ctc", False)
     # this loss can only operate in full precision
     # if self.params['dtype'] != tf.float32:
     #   deco_print("Warning: defaulting CTC loss to work in float32")
@@ -74,12 +82,35 @@ class CTCLoss(Loss):
     src_length = input_dict['decoder_output']['src_length']
 
     # Compute the CTC loss
-    total_loss = tf.nn.ctc_loss(
-        labels=dense_to_sparse(tgt_sequence, tgt_length),
-        inputs=logits,
-        sequence_length=src_length,
-        ignore_longer_outputs_than_inputs=True,
-    )
+    if self._use_gpu_ctc:
+      # same as ignore_longer_outputs_than_inputs: samples which can't be
+      # aligned get an empty label, so that their loss and gradient stay
+      # finite, and their loss is zeroed afterwards. Masking the infinite
+      # loss alone would still give nan gradients. Every repeated label
+      # needs a blank in between, so repeats count towards the length
+      repeats = tf.reduce_sum(tf.cast(tf.logical_and(
+          tf.equal(tgt_sequence[:, 1:], tgt_sequence[:, :-1]),
+          tf.sequence_mask(tgt_length - 1, tf.shape(tgt_sequence)[1] - 1),
+      ), tf.int32), axis=1)
+      valid = tf.less_equal(tgt_length + repeats, src_length)
+      # logits are time major, blank is the last class as in tf.nn.ctc_loss.
+      # Labels have to stay dense, sparse labels fall back to the CPU kernel
+      total_loss = tf.nn.ctc_loss_v2(
+          labels=tgt_sequence,
+          logits=logits,
+          label_length=tf.where(valid, tgt_length, tf.zeros_like(tgt_length)),
+          logit_length=src_length,
+          logits_time_major=True,
+          blank_index=-1,
+      )
+      total_loss = tf.where(valid, total_loss, tf.zeros_like(total_loss))
+    else:
+      total_loss = tf.nn.ctc_loss(
+          labels=dense_to_sparse(tgt_sequence, tgt_length),
+          inputs=logits,
+          sequence_length=src_length,
+          ignore_longer_outputs_than_inputs=True,
+      )
 
     if self._mask_nan:
       total_loss = mask_nans(total_loss)
@@ -0,0 +1,80 @@
+# Copyright (c) 2019 NVIDIA Corporation
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import numpy as np
+import numpy.testing as npt
+import tensorflow as tf
+
+from open_seq2seq.losses.ctc_loss import CTCLoss
+
+
+class GpuCTCLossEqualsCTCLossTest(tf.test.TestCase):
+  def setUp(self):
+    print("Setting Up  GpuCTCLossEqualsCTCLoss Test")
+
+  def tearDown(self):
+    print("Tear down  GpuCTCLossEqualsCTCLoss Test")
+
+  def test_compute_loss(self):
+    seq_length = 30
+    tgt_length = 8
+    tgt_vocab_size = 10
+
+    for batch_size in [4, 8]:
+      with tf.Graph().as_default():
+        # logits are time major, the last class is the blank label
+        logits = tf.placeholder(dtype=tf.float32, shape=[seq_length,
+                                                         batch_size,
+                                                         tgt_vocab_size])
+        targets = tf.placeholder(dtype=tf.int32, shape=[batch_size,
+                                                        tgt_length])
+        tgt_lengths = tf.placeholder(dtype=tf.int32, shape=[batch_size])
+        src_lengths = tf.placeholder(dtype=tf.int32, shape=[batch_size])
+        loss_input_dict = {
+            "decoder_output": {"logits": logits, "src_length": src_lengths},
+            "target_tensors": [targets, tgt_lengths],
+        }
+        ctc_loss = CTCLoss(params={}, model=None)
+        gpu_ctc_loss = CTCLoss(params={"use_gpu_ctc": True}, model=None)
+        l1 = ctc_loss.compute_loss(input_dict=loss_input_dict)
+        l2 = gpu_ctc_loss.compute_loss(input_dict=loss_input_dict)
+        g1 = tf.gradients(l1, logits)[0]
+        g2 = tf.gradients(l2, logits)[0]
+
+        with self.test_session(use_gpu=True) as sess:
+          # no repeated consecutive labels in the random samples, so every
+          # one of them with tgt_length <= src_length has a valid alignment
+          tgts = (np.arange(tgt_length)[np.newaxis, :] +
+                  np.random.randint(tgt_vocab_size - 1,
+                                    size=(batch_size, 1))) % \
+                 (tgt_vocab_size - 1)
+          tgt_lens = np.random.randint(1, tgt_length + 1, size=batch_size)
+          src_lens = np.random.randint(2 * tgt_length, seq_length + 1,
+                                       size=batch_size)
+          # the first sample can't be aligned and has to be ignored
+          src_lens[0] = tgt_lens[0] - 1
+          # repeated labels need a blank in between: the second sample is
+          # not longer than its input, but still can't be aligned
+          tgts[1] = np.arange(tgt_length) // 2
+          tgt_lens[1] = tgt_length
+          src_lens[1] = tgt_length + 2
+          # while the third one with the same labels can
+          tgts[2] = tgts[1]
+          tgt_lens[2] = tgt_length
+          src_lens[2] = tgt_length + tgt_length // 2
+          feed_dict = {
+              logits: np.random.randn(seq_length, batch_size, tgt_vocab_size),
+              targets: tgts,
+              tgt_lengths: tgt_lens,
+              src_lengths: src_lens,
+          }
+          loss1, loss2, grad1, grad2 = sess.run([l1, l2, g1, g2],
+                                                feed_dict=feed_dict)
+          self.assertAlmostEqual(loss1, loss2, 4)
+          self.assertTrue(np.all(np.isfinite(grad2)))
+          npt.assert_allclose(grad1, grad2, rtol=1e-4, atol=1e-5)
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -107,6 +107,12 @@ class Model:
 
         # Parameters for XLA
         'use_xla_jit' : bool,
+
+        # Parameters for TF automatic mixed precision graph rewrite
+        'auto_mixed_precision': bool,
+
+        # Parameters for Horovod
+        'horovod_fp16_allreduce': bool,
     }
 
   def __init__(self, params, mode="train", hvd=None):
@@ -233,6 +239,14 @@ class Model:
       * **min_update** (float) --- minimal value of the LARC (LARS) update.
       * **epsilon** (float) --- small number added to gradient norm in
         denominator for numerical stability.
+    * **auto_mixed_precision** (bool) --- whether to wrap the optimizer with
+      TensorFlow's automatic mixed precision graph rewrite, which casts
+      eligible ops (convolutions, matmuls) to float16 and applies dynamic loss
+      scaling. Requires TensorFlow 1.14 or newer, ``dtype`` to be
+      ``tf.float32`` and ``loss_scaling`` to not be set. Defaults to False.
+    * **horovod_fp16_allreduce** (bool) --- whether to compress gradients to
+      float16 before Horovod allreduce, which halves the communication volume.
+      Only used when ``use_horovod`` is True. Defaults to False.
     """
     check_params(params, self.get_required_params(), self.get_optional_params())
 
@@ -254,6 +268,18 @@ class Model:
     if "use_trt" in params and self._mode != "infer":
       raise ValueError("TensorRT can only be used in inference mode.")
 
+    if params.get('auto_mixed_precision', False):
+      if not hasattr(getattr(tf.train, 'experimental', None),
+                     'enable_mixed_precision_graph_rewrite'):
+        raise ValueError("auto_mixed_precision requires TensorFlow 1.14 or "
+                         "newer. Please, use dtype='mixed' instead.")
+      if params.get('dtype', tf.float32) != tf.float32:
+        raise ValueError("auto_mixed_precision requires dtype to be "
+                         "tf.float32, the graph rewrite does the casting.")
+      if 'loss_scaling' in params:
+        raise ValueError("auto_mixed_precision uses its own dynamic loss "
+                         "scaling. Please, remove loss_scaling from the config.")
+
     if "max_steps" in params and "num_epochs" in params:
       raise ValueError("You can't provide both max_steps and num_epochs. "
                        "Please, remove one of them from the config.")
@@ -521,6 +547,9 @@ class Model:
           on_horovod=self.on_horovod,
           iter_size=self.params.get('iter_size', 1),
           skip_update_ph=self.skip_update_ph,
+          auto_mixed_precision=self.params.get('auto_mixed_precision', False),
+          horovod_fp16_allreduce=self.params.get('horovod_fp16_allreduce',
+                                                 False),
           model=self
       )
       tf.summary.scalar(name="train_loss", tensor=self.loss)
@@ -963,6 +992,13 @@ class Model:
     """
     return len(self._gpu_ids)
 
+  @property
+  def gpu_ids(self):
+    """Ids of the GPUs the model towers are placed on.
+    For Horovod this is always ``[0]``, since each process sees only one GPU.
+    """
+    return list(self._gpu_ids)
+
   @property
   def mode(self):
     """Mode the model is executed in ("train", "eval" or "infer")."""
@@ -41,6 +41,9 @@ class DS2ModelTests(Speech2TextModelTests):
   def test_maybe_functions(self):
     return self.maybe_functions_test()
 
+  def test_auto_mixed_precision(self):
+    return self.auto_mixed_precision_test()
+
 
 if __name__ == '__main__':
   tf.test.main()
@@ -349,3 +349,68 @@ class Speech2TextModelTests(tf.test.TestCase):
                 'target_tensors': [input_values[0][2], input_values[0][3]]}
     output_dict = model.maybe_print_logs(inp_dict, output_values[0], 0)
     self.assertEqual(output_dict['Sample WER'], 0.4)
+
+  def auto_mixed_precision_test(self):
+    train_config, eval_config = self.prepare_config()
+    train_config['auto_mixed_precision'] = True
+
+    for dtype in [tf.float16, 'mixed']:
+      config = copy.deepcopy(train_config)
+      config['dtype'] = dtype
+      with tf.Graph().as_default():
+        with self.assertRaises(ValueError):
+          # pylint: disable=not-callable
+          self.base_model(params=config, mode="train", hvd=None)
+
+    config = copy.deepcopy(train_config)
+    config['loss_scaling'] = 'Backoff'
+    with tf.Graph().as_default():
+      with self.assertRaises(ValueError):
+        # pylint: disable=not-callable
+        self.base_model(params=config, mode="train", hvd=None)
+
+    if not hasattr(getattr(tf.train, 'experimental', None),
+                   'enable_mixed_precision_graph_rewrite'):
+      with tf.Graph().as_default():
+        with self.assertRaises(ValueError):
+          # pylint: disable=not-callable
+          self.base_model(params=train_config, mode="train", hvd=None)
+      print("TensorFlow is older than 1.14, skipping positive "
+            "auto_mixed_precision test")
+      return
+
+    with tf.Graph().as_default():
+      # pylint: disable=not-callable
+      model = self.base_model(params=train_config, mode="train", hvd=None)
+      model.compile()
+      # the optimizer is wrapped with dynamic loss scaling
+      self.assertTrue(any('loss_scale' in var.name
+                          for var in tf.global_variables()))
+
+    train_config['num_epochs'] = 10
+    loss, eval_loss, _ = self.run_model(train_config, eval_config)
+    self.assertTrue(np.isfinite(loss))
+    self.assertTrue(np.isfinite(eval_loss))
+
+    try:
+      import horovod.tensorflow as hvd
+      hvd.init()
+    except ImportError:
+      print("Horovod not installed, skipping auto_mixed_precision "
+            "test with iter_size")
+      return
+
+    train_config, eval_config = self.prepare_config()
+    train_config.update({
+        "auto_mixed_precision": True,
+        "iter_size": 2,
+        "use_horovod": True,
+        "num_epochs": 10,
+    })
+    eval_config.update({
+        "iter_size": 2,
+        "use_horovod": True,
+    })
+    loss, eval_loss, _ = self.run_model(train_config, eval_config, hvd)
+    self.assertTrue(np.isfinite(loss))
+    self.assertTrue(np.isfinite(eval_loss))
@@ -74,9 +74,15 @@ def get_regularization_loss(scope=None, name="total_regularization_loss"):
     return tf.constant(0.0)
 
 
-def reduce_gradients(grads_and_vars, on_horovod, model=None):
+def reduce_gradients(grads_and_vars, on_horovod, model=None,
+                     fp16_allreduce=False):
   if on_horovod:
-    from horovod.tensorflow import allreduce, size
+    from horovod.tensorflow import allreduce, size, Compression
+
+    if fp16_allreduce:
+      compression = Compression.fp16
+    else:
+      compression = Compression.none
 
     if size() > 1:
       averaged_grads_and_vars = []
@@ -93,7 +99,10 @@ def reduce_gradients(grads_and_vars, on_horovod, model=None):
                     values=summed_values,
                     dense_shape=grad.dense_shape)
                 grad = tf.convert_to_tensor(gradient_no_duplicate_indices)
-            avg_grad = allreduce(grad)
+            # keeping allreduce on the gradient's device lets NCCL reduce
+            # GPU tensors in place instead of staging them through host memory
+            with tf.colocate_with(grad):
+              avg_grad = allreduce(grad, compression=compression)
             averaged_grads_and_vars.append((avg_grad, var))
           else:
             averaged_grads_and_vars.append((None, var))
@@ -118,6 +127,8 @@ def optimize_loss(loss,
                   on_horovod=False,
                   iter_size=1,
                   skip_update_ph=None,
+                  auto_mixed_precision=False,
+                  horovod_fp16_allreduce=False,
                   model=None):
   """Given loss and parameters for optimizer, returns a training op.
 
@@ -150,6 +161,11 @@ def optimize_loss(loss,
         loss scaling algorithm is used. Must be one of 'Backoff'
         of 'LogMax' (case insensitive). Only used when dtype="mixed".
     on_horovod: whether the model is run on horovod.
+    auto_mixed_precision: whether to wrap the optimizer with TensorFlow's
+        automatic mixed precision graph rewrite (with dynamic loss scaling).
+        Only used when dtype=tf.float32.
+    horovod_fp16_allreduce: whether to compress gradients to float16 before
+        Horovod allreduce (halves the communication volume).
 
   Returns:
     training op.
@@ -203,6 +219,10 @@ def optimize_loss(loss,
 
     if dtype == 'mixed':
       opt = MixedPrecisionOptimizerWrapper(opt, loss_scale=loss_scaling)
+    elif auto_mixed_precision:
+      opt = tf.train.experimental.enable_mixed_precision_graph_rewrite(
+          opt, loss_scale="dynamic",
+      )
 
     # Compute gradients.
     grads_and_vars = opt.compute_gradients(
@@ -239,7 +259,10 @@ def optimize_loss(loss,
           with tf.control_dependencies([accum_op]):
             red_grad_updates = opt.apply_gradients(
                 post_process_gradients(
-                    reduce_gradients(grads_and_vars_accum, on_horovod=True, model=model),
+                    reduce_gradients(
+                        grads_and_vars_accum, on_horovod=True, model=model,
+                        fp16_allreduce=horovod_fp16_allreduce,
+                    ),
                     lr=lr,
                     clip_gradients=clip_gradients,
                     larc_params=larc_params,
@@ -260,7 +283,10 @@ def optimize_loss(loss,
       else:
         grad_updates = opt.apply_gradients(
             post_process_gradients(
-                reduce_gradients(grads_and_vars, on_horovod=True, model=model),
+                reduce_gradients(
+                    grads_and_vars, on_horovod=True, model=model,
+                    fp16_allreduce=horovod_fp16_allreduce,
+                ),
                 lr=lr,
                 clip_gradients=clip_gradients,
                 larc_params=larc_params,
@@ -29,18 +29,18 @@ from tensorflow.python.framework import ops
 from tensorflow.python.ops import math_ops
 from tensorflow.python.ops import array_ops
 from tensorflow.python.ops import control_flow_ops
-from tensorflow.python.ops import tensor_array_ops
 from tensorflow.python.util import nest
 
 _transpose_batch_time = decoder._transpose_batch_time
 
 
-def _unstack_ta(inp):
-  return tensor_array_ops.TensorArray(
-      dtype=inp.dtype,
-      size=array_ops.shape(inp)[0],
-      element_shape=inp.get_shape()[1:]
-  ).unstack(inp)
+def _zero_frame(inp):
+  # inp is time major, use a constant when the frame shape is static so that
+  # it can be folded at graph construction
+  frame_shape = inp.get_shape()[1:]
+  if frame_shape.is_fully_defined():
+    return array_ops.zeros(frame_shape, dtype=inp.dtype)
+  return array_ops.zeros_like(inp[0, :])
 
 
 class TacotronTrainingHelper(Helper):
@@ -75,19 +75,23 @@ class TacotronTrainingHelper(Helper):
 
     if not time_major:
       inputs = nest.map_structure(_transpose_batch_time, inputs)
-    self._input_tas = nest.map_structure(_unstack_ta, inputs)
+    # teacher forcing inputs are fully materialized, so frames are sliced
+    # directly from the time major tensor instead of going through a
+    # TensorArray
+    self._inputs_time_major = inputs
     self._sequence_length = sequence_length
-    self._batch_size = array_ops.size(sequence_length)
-    self._seed = None
+    # use a python int when the batch size is known at graph construction
+    self._batch_size = sequence_length.get_shape().with_rank(1)[0].value
+    if self._batch_size is None:
+      self._batch_size = array_ops.size(sequence_length)
+    # created once outside of the decoder loop and reused at every step
+    self._unfinished = array_ops.zeros([self._batch_size], dtype=dtypes.bool)
     self._mask_decoder_sequence = mask_decoder_sequence
     self._prenet = prenet
-    self._zero_inputs = nest.map_structure(
-        lambda inp: array_ops.zeros_like(inp[0, :]), inputs
-    )
+    self._zero_inputs = nest.map_structure(_zero_frame, inputs)
     self._start_inputs = self._zero_inputs
     if prenet is not None:
       self._start_inputs = self._prenet(self._zero_inputs)
-    self._last_dim = self._start_inputs.get_shape()[-1]
     self._dtype = model_dtype
 
   @property
@@ -103,8 +107,7 @@ class TacotronTrainingHelper(Helper):
     return self._sample_ids_dtype
 
   def initialize(self, name=None):
-    finished = array_ops.tile([False], [self._batch_size])
-    return (finished, self._start_inputs)
+    return (self._unfinished, self._start_inputs)
 
   def sample(self, time, outputs, state, name=None):
     # Fully deterministic, output should already be projected
@@ -117,20 +120,21 @@ class TacotronTrainingHelper(Helper):
     if self._mask_decoder_sequence:
       finished = (next_time >= self._sequence_length)
     else:
-      finished = array_ops.tile([False], [self._batch_size])
+      finished = self._unfinished
     all_finished = math_ops.reduce_all(finished)
 
-    def get_next_input(inp, out):
-      next_input = inp.read(time)
-      if self._prenet is not None:
-        next_input = self._prenet(next_input)
-        out = self._prenet(out)
-      return next_input
-
+    # Pure teacher forcing: the next input is always the ground truth frame,
+    # so the decoder outputs never need to go through the prenet here.
+    # The cond only selects the raw frame, the prenet is then applied once
+    # outside of it instead of being duplicated in both branches
     next_inputs = control_flow_ops.cond(
-        all_finished, lambda: self._start_inputs,
-        lambda: get_next_input(self._input_tas, outputs)
+        all_finished, lambda: self._zero_inputs,
+        lambda: nest.map_structure(
+            lambda inp: array_ops.gather(inp, time), self._inputs_time_major
+        )
     )
+    if self._prenet is not None:
+      next_inputs = self._prenet(next_inputs)
 
     return (finished, next_inputs, state)
 
@@ -162,7 +166,11 @@ class TacotronHelper(Helper):
     """
     self._sample_ids_shape = tensor_shape.TensorShape(sample_ids_shape or [])
     self._sample_ids_dtype = sample_ids_dtype or dtypes.int32
-    self._batch_size = inputs.get_shape()[0]
+    self._batch_size = inputs.get_shape()[0].value
+    if self._batch_size is None:
+      self._batch_size = array_ops.shape(inputs)[0]
+    # created once outside of the decoder loop and reused at every step
+    self._unfinished = array_ops.zeros([self._batch_size], dtype=dtypes.bool)
     self._mask_decoder_sequence = mask_decoder_sequence
 
     if not time_major:
@@ -188,8 +196,7 @@ class TacotronHelper(Helper):
     return self._sample_ids_dtype
 
   def initialize(self, name=None):
-    finished = array_ops.tile([False], [self._batch_size])
-    return (finished, self._start_inputs)
+    return (self._unfinished, self._start_inputs)
 
   def sample(self, time, outputs, state, name=None):
     # Fully deterministic, output should already be projected
@@ -207,20 +214,16 @@ class TacotronHelper(Helper):
     # Also decides whether the decoder is finished
     next_time = time + 1
     if self._mask_decoder_sequence:
-      stop_token_predictions = tf.sigmoid(stop_token_predictions)
-      finished = tf.cast(tf.round(stop_token_predictions), tf.bool)
-      finished = tf.squeeze(finished)
+      # equivalent to round(sigmoid(x)) up to rounding of sigmoid near 0,
+      # so compare the logits directly instead of computing the sigmoid
+      finished = tf.squeeze(stop_token_predictions > 0., axis=-1)
     else:
-      finished = array_ops.tile([False], [self._batch_size])
-    all_finished = math_ops.reduce_all(finished)
-
-    def get_next_input(out):
-      if self._prenet is not None:
-        out = self._prenet(out)
-      return out
-
-    next_inputs = control_flow_ops.cond(
-        all_finished, lambda: self._start_inputs,
-        lambda: get_next_input(outputs)
-    )
+      finished = self._unfinished
+
+    # The start inputs were only selected once every example had finished,
+    # at which point dynamic_decode stops and never consumes them, so the
+    # outputs can be fed back unconditionally without a reduction and a cond
+    next_inputs = outputs
+    if self._prenet is not None:
+      next_inputs = self._prenet(next_inputs)
     return (finished, next_inputs, state)
@@ -230,6 +230,9 @@ def restore_and_get_results(model, checkpoint, mode):
   if model.hvd:
     # pylint: disable=no-member
     sess_config.gpu_options.visible_device_list = str(model.hvd.local_rank())
+  if model.params.get('use_xla_jit', False):
+    sess_config.graph_options.optimizer_options.global_jit_level = (
+        tf.OptimizerOptions.ON_1)
   with tf.Session(config=sess_config) as sess:
     if not model.params.get("use_trt", False):
       assign_ops, restore_dict = get_assign_ops_and_restore_dict(
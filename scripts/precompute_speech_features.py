@@ -0,0 +1,90 @@
+# Copyright (c) 2019 NVIDIA Corporation
+"""This script computes the audio features of all files listed in the dataset
+.csv files of a Speech2Text config and stores them in the on-disk feature
+cache used by ``cache_features``.
+
+Training with ``"cache_features": True`` in ``data_layer_params`` then only
+loads the stored features instead of re-computing them every epoch.
+Note that the cache is keyed by the pre-processing parameters, so features
+with random augmentation will be frozen to a single realization.
+
+Usage::
+
+    python scripts/precompute_speech_features.py --config_file=... \
+      --modes train eval --num_jobs=16
+"""
+from __future__ import absolute_import, division, print_function
+from __future__ import unicode_literals
+
+import argparse
+import copy
+import os
+import runpy
+import sys
+sys.path.append(os.getcwd())
+
+import tensorflow as tf
+from joblib import Parallel, delayed
+from tqdm import tqdm
+
+from open_seq2seq.data.speech2text.speech_utils import \
+    get_speech_features_from_file
+from open_seq2seq.utils.utils import deco_print, nested_update
+
+
+def _cache_features(filename, params):
+  get_speech_features_from_file(filename, params=params)
+
+
+def get_data_layer_params(config_module, mode):
+  """Returns data layer class and parameters for ``mode`` with the same
+  merging rules that are used by ``create_model``."""
+  config = copy.deepcopy(config_module['base_params'])
+  if mode + '_params' in config_module:
+    nested_update(config, copy.deepcopy(config_module[mode + '_params']))
+  return config['data_layer'], config['data_layer_params']
+
+
+def main():
+  parser = argparse.ArgumentParser(
+      description='Pre-compute speech features of a Speech2Text dataset'
+  )
+  parser.add_argument("--config_file", required=True,
+                      help="Path to the configuration file")
+  parser.add_argument("--modes", nargs='+', default=['train', 'eval'],
+                      help="Which config sections to pre-compute features "
+                           "for. Could contain \"train\", \"eval\" or "
+                           "\"infer\"")
+  parser.add_argument("--num_jobs", type=int, default=os.cpu_count(),
+                      help="Number of parallel processes to use")
+  parser.add_argument('--regenerate', dest='regenerate', action='store_true',
+                      help="whether to overwrite already cached features")
+  args = parser.parse_args()
+
+  config_module = runpy.run_path(args.config_file, init_globals={'tf': tf})
+
+  for mode in args.modes:
+    data_layer_cls, dl_params = get_data_layer_params(config_module, mode)
+    dl_params['mode'] = mode
+    dl_params['interactive'] = False
+    dl_params['cache_features'] = True
+    dl_params['cache_format'] = dl_params.get('cache_format', 'hdf5')
+    dl_params['cache_regenerate'] = args.regenerate
+    data_layer = data_layer_cls(
+        params=dl_params, model=None, num_workers=None, worker_id=None,
+    )
+
+    files = data_layer.all_files
+    if mode != 'infer':
+      files = files[:, 0]
+    deco_print("Pre-computing features for {} {} files".format(
+        len(files), mode
+    ))
+    Parallel(n_jobs=args.num_jobs)(
+        delayed(_cache_features)(filename, data_layer.params)
+        for filename in tqdm(files)
+    )
+
+
+if __name__ == '__main__':
+  main()